@@ -0,0 +1,188 @@
+/**
+ * Disk cache module for QuantStats.js
+ * Opt-in persistence of core statistics across runs over the same data.
+ * Kept out of the other modules so that only callers importing it from
+ * 'quantstats-js/src/cache.js' depend on Node's crypto and fs modules
+ */
+
+import { createHash } from 'node:crypto';
+import { mkdirSync, readFileSync, renameSync, rmSync, writeFileSync } from 'node:fs';
+import { dirname, join } from 'node:path';
+import { coreStatistics } from './stats.js';
+
+// Bump whenever the layout of a cache entry changes
+const CACHE_FORMAT = 1;
+
+// Below this many returns recomputing is cheaper than hashing and reading an entry
+const MIN_CACHED_LENGTH = 2000;
+
+// Scalar fields of coreStatistics() that are persisted
+const SCALAR_FIELDS = [
+  'n', 'mean', 'std', 'skew', 'kurtosis', 'ulcerIndex',
+  'valueAtRisk', 'cvar', 'probabilisticSharpeRatio'
+];
+
+let cacheTag = null;
+
+/**
+ * Scalar core statistics, read from an on-disk cache when available
+ * Entries are keyed by a hash of the input values, the nans flag, the
+ * library version and the entry format, so upgrades never serve stale
+ * results. Entries missing a field are recomputed and rewritten. Short or
+ * non-numeric inputs are computed directly, and a failed cache write only
+ * skips the write
+ * @param {Array} returns - Returns array
+ * @param {boolean} nans - Include NaN values (default false)
+ * @param {string} cacheDir - Cache directory, created on first write; relative
+ *   paths resolve against process.cwd() (default '.cache')
+ * @returns {Object} Scalar fields of coreStatistics()
+ */
+export function cachedCoreStatistics(returns, nans = false, cacheDir = '.cache') {
+  const values = toFloat64(returns);
+
+  if (values === null || values.length < MIN_CACHED_LENGTH) {
+    return scalarStatistics(coreStatistics(returns, nans));
+  }
+
+  const key = createHash('sha256')
+    .update(`${getCacheTag()}:${nans ? 1 : 0}:`)
+    .update(new Uint8Array(values.buffer))
+    .digest('hex')
+    .slice(0, 32);
+  const path = join(cacheDir, `core-${key}.json`);
+
+  try {
+    const cached = JSON.parse(readFileSync(path, 'utf8'), reviveNonFinite);
+
+    if (isCompleteEntry(cached)) {
+      return cached;
+    }
+  } catch (error) {
+    // Missing, unreadable or partial entry - recompute and write it below
+  }
+
+  const result = scalarStatistics(coreStatistics(returns, nans));
+  writeEntry(path, result);
+
+  return result;
+}
+
+/**
+ * Copy an array of numbers into a Float64Array
+ * Their float64 bytes then identify the coreStatistics() input exactly
+ * @param {Array} returns - Returns array
+ * @returns {Float64Array|null} Values, or null if any element is not a number
+ */
+function toFloat64(returns) {
+  if (!Array.isArray(returns)) {
+    return null;
+  }
+
+  const values = new Float64Array(returns.length);
+
+  for (let i = 0; i < returns.length; i++) {
+    const val = returns[i];
+
+    if (typeof val !== 'number') {
+      return null;
+    }
+
+    values[i] = val;
+  }
+
+  return values;
+}
+
+/**
+ * Library version and entry format, mixed into every cache key
+ * @returns {string} Cache tag
+ */
+function getCacheTag() {
+  if (cacheTag === null) {
+    let version = 'unknown';
+
+    try {
+      version = JSON.parse(readFileSync(new URL('../package.json', import.meta.url), 'utf8')).version;
+    } catch (error) {
+      // Fall back to the format constant alone
+    }
+
+    cacheTag = `quantstats-js@${version}/${CACHE_FORMAT}`;
+  }
+
+  return cacheTag;
+}
+
+/**
+ * Pick the persisted scalar fields of a coreStatistics() result
+ * @param {Object} core - Result of coreStatistics()
+ * @returns {Object} Scalar statistics
+ */
+function scalarStatistics(core) {
+  const result = {};
+
+  for (const field of SCALAR_FIELDS) {
+    result[field] = core[field];
+  }
+
+  return result;
+}
+
+/**
+ * Check that a parsed entry holds a number for every persisted field
+ * @param {*} entry - Parsed cache entry
+ * @returns {boolean} True if the entry can be served
+ */
+function isCompleteEntry(entry) {
+  if (entry === null || typeof entry !== 'object') {
+    return false;
+  }
+
+  return SCALAR_FIELDS.every(field => typeof entry[field] === 'number');
+}
+
+/**
+ * Write a cache entry through a temporary file, so concurrent runs never read
+ * a partial entry; failures are ignored, leaving the entry uncached
+ * @param {string} path - Entry path
+ * @param {Object} result - Scalar statistics
+ */
+function writeEntry(path, result) {
+  const tempPath = `${path}.${process.pid}.tmp`;
+
+  try {
+    mkdirSync(dirname(path), { recursive: true });
+    writeFileSync(tempPath, JSON.stringify(result, replaceNonFinite));
+    renameSync(tempPath, path);
+  } catch (error) {
+    try {
+      rmSync(tempPath, { force: true });
+    } catch (cleanupError) {
+      // Nothing was written
+    }
+  }
+}
+
+/**
+ * JSON replacer keeping NaN, +/-Infinity and -0 (JSON would lose them)
+ * @param {string} key - Property key
+ * @param {*} value - Property value
+ * @returns {*} Value to serialize
+ */
+function replaceNonFinite(key, value) {
+  if (Object.is(value, -0)) {
+    return '-0';
+  }
+
+  return typeof value === 'number' && !isFinite(value) ? String(value) : value;
+}
+
+/**
+ * JSON reviver restoring the values written by replaceNonFinite()
+ * @param {string} key - Property key
+ * @param {*} value - Parsed value
+ * @returns {*} Restored value
+ */
+function reviveNonFinite(key, value) {
+  return value === 'NaN' || value === 'Infinity' || value === '-Infinity' || value === '-0' ? Number(value) : value;
+}
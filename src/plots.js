@@ -8,6 +8,7 @@ import {
   toDrawdownSeries, 
   portfolioValue,
   aggregateReturns,
+  sumSquaredDeviations,
   TRADING_DAYS_PER_YEAR 
 } from './utils.js';
 
@@ -129,21 +130,29 @@ export function rollingStats(returns, window = 252, stat = 'volatility', nans =
   
   const rollingValues = [];
   
+  // Each window is scanned in place: no slice or re-preparation per step
   for (let i = window; i <= cleanReturns.length; i++) {
-    const windowReturns = cleanReturns.slice(i - window, i);
+    const start = i - window;
+    let sum = 0;
+    
+    for (let j = start; j < i; j++) {
+      sum += cleanReturns[j];
+    }
+    
+    const mean = sum / window;
+    const sumSq = sumSquaredDeviations(cleanReturns, mean, start, i);
     
     let value;
     switch (stat.toLowerCase()) {
       case 'volatility':
-        value = volatility(windowReturns, nans);
+        // Sample standard deviation (ddof=1), annualized like volatility()
+        value = window > 1 ? Math.sqrt(sumSq / (window - 1)) * Math.sqrt(TRADING_DAYS_PER_YEAR) : 0;
         break;
-      case 'sharpe':
-        // Import sharpe function here to avoid circular dependency
-        const mean = windowReturns.reduce((sum, ret) => sum + ret, 0) / windowReturns.length;
-        const variance = windowReturns.reduce((sum, ret) => sum + Math.pow(ret - mean, 2), 0) / windowReturns.length;
-        const std = Math.sqrt(variance);
+      case 'sharpe': {
+        const std = Math.sqrt(sumSq / window);
         value = std === 0 ? 0 : (mean * Math.sqrt(TRADING_DAYS_PER_YEAR)) / (std * Math.sqrt(TRADING_DAYS_PER_YEAR));
         break;
+      }
       default:
         value = 0;
     }
@@ -233,7 +242,7 @@ export function snapshot(returns, nans = false) {
   
   // Calculate other metrics
   const mean = cleanReturns.reduce((sum, ret) => sum + ret, 0) / cleanReturns.length;
-  const variance = cleanReturns.reduce((sum, ret) => sum + Math.pow(ret - mean, 2), 0) / cleanReturns.length;
+  const variance = sumSquaredDeviations(cleanReturns, mean) / cleanReturns.length;
   const std = Math.sqrt(variance);
   const sharpeRatio = std === 0 ? 0 : (mean * Math.sqrt(TRADING_DAYS_PER_YEAR)) / (std * Math.sqrt(TRADING_DAYS_PER_YEAR));
   
@@ -416,18 +425,23 @@ export function drawdownsPeriods(returns, nans = false) {
   const periods = [];
   let inDrawdown = false;
   let startIndex = 0;
+  let periodMin = 0;
   
+  // Running minimum of the current period instead of re-scanning its slice
   for (let i = 0; i < drawdowns.length; i++) {
     if (drawdowns[i] < 0 && !inDrawdown) {
       inDrawdown = true;
       startIndex = i;
+      periodMin = drawdowns[i];
     } else if (drawdowns[i] >= 0 && inDrawdown) {
       inDrawdown = false;
       periods.push({
         start: startIndex,
         end: i - 1,
-        maxDrawdown: Math.min(...drawdowns.slice(startIndex, i))
+        maxDrawdown: periodMin
       });
+    } else if (inDrawdown) {
+      periodMin = Math.min(periodMin, drawdowns[i]);
     }
   }
   
@@ -549,18 +563,29 @@ export function rollingSortino(returns, window = 252, nans = false) {
   const rollingSortinos = [];
   
   for (let i = window; i <= cleanReturns.length; i++) {
-    const windowReturns = cleanReturns.slice(i - window, i);
+    // Mean and downside sum of squares in one in-place pass over the window
+    let sum = 0;
+    let negativeCount = 0;
+    let downsideSumSq = 0;
+    
+    for (let j = i - window; j < i; j++) {
+      const ret = cleanReturns[j];
+      sum += ret;
+      
+      if (ret < 0) {
+        negativeCount++;
+        downsideSumSq += ret * ret;
+      }
+    }
     
-    // Calculate Sortino ratio
-    const mean = windowReturns.reduce((sum, ret) => sum + ret, 0) / windowReturns.length;
-    const negativeReturns = windowReturns.filter(ret => ret < 0);
+    const mean = sum / window;
     
-    if (negativeReturns.length === 0) {
+    if (negativeCount === 0) {
       rollingSortinos.push(mean > 0 ? Infinity : 0);
       continue;
     }
     
-    const downsideVariance = negativeReturns.reduce((sum, ret) => sum + Math.pow(ret, 2), 0) / windowReturns.length;
+    const downsideVariance = downsideSumSq / window;
     const downsideDeviation = Math.sqrt(downsideVariance);
     
     const sortino = downsideDeviation === 0 ? 0 : (mean * Math.sqrt(TRADING_DAYS_PER_YEAR)) / (downsideDeviation * Math.sqrt(TRADING_DAYS_PER_YEAR));
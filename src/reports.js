@@ -16,6 +16,9 @@ export function metrics(returns, rfRate = 0, nans = false) {
     throw new Error('No valid returns data');
   }
 
+  // Moments, drawdowns, VaR/CVaR and ulcer are computed once and shared
+  const core = stats.coreStatistics(cleanReturns, nans);
+
   const metrics = {
     // Core performance metrics
     totalReturn: stats.compoundReturn(cleanReturns, nans),
@@ -27,11 +30,11 @@ export function metrics(returns, rfRate = 0, nans = false) {
     
     // Risk metrics
     maxDrawdown: stats.maxDrawdown(cleanReturns, nans),
-    valueAtRisk: stats.valueAtRisk(cleanReturns, 1, 0.95, nans),
-    conditionalValueAtRisk: stats.cvar(cleanReturns, 1, 0.95, nans),
-    skew: stats.skew(cleanReturns, nans),
-    kurtosis: stats.kurtosis(cleanReturns, nans),
-    ulcerIndex: stats.ulcerIndex(cleanReturns, nans),
+    valueAtRisk: core.valueAtRisk,
+    conditionalValueAtRisk: core.cvar,
+    skew: core.skew,
+    kurtosis: core.kurtosis,
+    ulcerIndex: core.ulcerIndex,
     
     // Trading metrics
     kelly: stats.kelly(cleanReturns, nans),
@@ -39,12 +42,12 @@ export function metrics(returns, rfRate = 0, nans = false) {
     winRate: stats.winRate(cleanReturns, nans),
     
     // Advanced metrics
-    probabilisticSharpeRatio: stats.probabilisticSharpeRatio(cleanReturns, 0, 252, nans),
+    probabilisticSharpeRatio: core.probabilisticSharpeRatio,
     omega: stats.omega(cleanReturns, 0, nans),
     
     // Drawdown details
     drawdownInfo: (() => {
-      const ddSeries = utils.toDrawdownSeries(cleanReturns, nans);
+      const ddSeries = core.drawdowns;
       const ddDetails = utils.drawdownDetails(cleanReturns, nans);
       
       const maxDd = Math.min(...ddSeries);
@@ -1041,11 +1044,14 @@ function generateUnderwaterChart(returns, dates, title = 'Underwater Chart (Draw
     drawdowns.push(drawdown);
   }
   
+  // Deepest drawdown, found once for both the plot scale and the axis
+  const minDrawdown = drawdowns.reduce((min, dd) => Math.min(min, dd), 0);
+  
   // Prepare data points for plotting
   const dataPoints = [];
   for (let i = 0; i < drawdowns.length; i++) {
     const x = margin.left + (i / (drawdowns.length - 1)) * chartWidth;
-    const yPos = margin.top + chartHeight - ((drawdowns[i] - Math.min(...drawdowns)) / (0 - Math.min(...drawdowns))) * chartHeight;
+    const yPos = margin.top + chartHeight - ((drawdowns[i] - minDrawdown) / (0 - minDrawdown)) * chartHeight;
     dataPoints.push({ x, y: yPos, value: drawdowns[i] });
   }
   
@@ -1074,7 +1080,6 @@ function generateUnderwaterChart(returns, dates, title = 'Underwater Chart (Draw
     ` L ${margin.left} ${dataPoints[0].y} Z`;
   
   // Calculate axis values
-  const minDrawdown = Math.min(...drawdowns);
   const maxDrawdown = 0; // Always 0 at the top
   
   // Generate Y-axis ticks
@@ -1493,7 +1498,7 @@ function generateReturnsDistributionChart(returns, dates, title = 'Returns Distr
   
   // Calculate statistics for overlay
   const mean = returnsData.reduce((sum, r) => sum + r, 0) / returnsData.length;
-  const variance = returnsData.reduce((sum, r) => sum + Math.pow(r - mean, 2), 0) / (returnsData.length - 1);
+  const variance = utils.sumSquaredDeviations(returnsData, mean) / (returnsData.length - 1);
   const stdDev = Math.sqrt(variance);
   
   // Generate normal distribution overlay
@@ -1626,8 +1631,13 @@ export function basic(returns, title = 'Portfolio Performance Report', rfRate =
   const endDate = normalizedReturns?.index?.[normalizedReturns.index.length - 1]?.toISOString().split('T')[0];
   const dateRange = `${startDate} - ${endDate}`;
 
+  // Clean the returns once for the metrics and drawdown table views
+  const cleanReturns = Array.isArray(normalizedReturns?.values)
+    ? utils.prepareReturns(normalizedReturns.values, 0, false)
+    : null;
+
   // Calculate actual comprehensive metrics using normalized data
-  const performanceMetrics = calculateComprehensiveMetrics(normalizedReturns, rfRate, 'full');
+  const performanceMetrics = calculateComprehensiveMetrics(normalizedReturns, rfRate, 'full', rfRate === 0 ? cleanReturns : null);
   
   // Calculate benchmark metrics if provided (using normalized data)
   let benchmarkMetrics = null;
@@ -2085,7 +2095,7 @@ export function basic(returns, title = 'Portfolio Performance Report', rfRate =
 
         <div id="ddinfo">
           <h3>Worst 30 Drawdowns</h3>
-          ${generateDrawdownTable(normalizedReturns)}
+          ${generateDrawdownTable(normalizedReturns, cleanReturns)}
         </div>
       </div>
     </div>
@@ -2122,19 +2132,29 @@ export function html(returns, filename = 'quantstats_report.html', title = null,
 export { metrics as performanceMetrics };
 
 // Helper functions for HTML generation
-export function calculateComprehensiveMetrics(returns, rfRate = 0, mode = 'basic') {
+
+/**
+ * Calculate the tearsheet metrics table
+ * @param {Object} returns - Returns object with {values, index}
+ * @param {number} rfRate - Risk-free rate (default 0)
+ * @param {string} mode - Metrics mode (default 'basic')
+ * @param {Array} cleanReturns - returns.values already prepared with rfRate, if available
+ * @returns {Object} Formatted metrics
+ */
+export function calculateComprehensiveMetrics(returns, rfRate = 0, mode = 'basic', cleanReturns = null) {
   if (!returns || !returns.values || returns.values.length === 0 || !returns.index) {
     throw new Error('Invalid returns data provided - missing values or index');
   }
 
   try {
-    const cleanReturns = utils.prepareReturns(returns.values, rfRate, false);
+    cleanReturns = cleanReturns || utils.prepareReturns(returns.values, rfRate, false);
     
     if (cleanReturns.length === 0) {
       throw new Error('No valid returns after preparation');
     }
 
     const metrics = {};
+    const core = stats.coreStatistics(cleanReturns, false);
     const pct = 100; // For percentage conversion
     const blank = ""; // For spacing in Python style
     
@@ -2168,7 +2188,7 @@ export function calculateComprehensiveMetrics(returns, rfRate = 0, mode = 'basic
     // Calculate Smart Sharpe (if in full mode)
     if (mode.toLowerCase() === 'full') {
       try {
-        const psr = stats.probabilisticSharpeRatio(cleanReturns, 0, 252, false);
+        const psr = core.probabilisticSharpeRatio;
         metrics['Prob. Sharpe Ratio %'] = (psr * pct).toFixed(2) + '%';
         const smartSharpeValue = stats.smartSharpe(cleanReturns, rfRate, 252, false);
         metrics['Smart Sharpe'] = smartSharpeValue.toFixed(2);
@@ -2206,8 +2226,8 @@ export function calculateComprehensiveMetrics(returns, rfRate = 0, mode = 'basic
     metrics['Calmar'] = calmar.toFixed(2);
     
     // Skewness and Kurtosis
-    const skewness = stats.skew(cleanReturns, false);
-    const kurtosisVal = stats.kurtosis(cleanReturns, false);
+    const skewness = core.skew;
+    const kurtosisVal = core.kurtosis;
     metrics['Skew'] = skewness.toFixed(2);
     metrics['Kurtosis'] = kurtosisVal.toFixed(2);
     
@@ -2234,7 +2254,7 @@ export function calculateComprehensiveMetrics(returns, rfRate = 0, mode = 'basic
     
     // VaR metrics
     try {
-      const var95 = stats.valueAtRisk(cleanReturns, 1, 0.95, false);
+      const var95 = core.valueAtRisk;
       const cvar95 = stats.cvar(cleanReturns, 0.05, false);
       
       metrics['Daily Value-at-Risk %'] = (var95 * pct).toFixed(2) + '%';
@@ -2342,7 +2362,7 @@ export function calculateComprehensiveMetrics(returns, rfRate = 0, mode = 'basic
     
     // Recovery and other indices
     const recoveryFactor = Math.abs(maxDrawdown) > 0 ? totalReturn / Math.abs(maxDrawdown) : 0;
-    const ulcer = stats.ulcerIndex(cleanReturns, false);
+    const ulcer = core.ulcerIndex;
     const serenity = stats.serenityIndex(cleanReturns, false);
     
     metrics['Recovery Factor'] = recoveryFactor.toFixed(2);
@@ -2618,7 +2638,7 @@ function generateEOYTable(returns, benchmark = null, benchmarkTitle = 'Benchmark
   }
 }
 
-function generateDrawdownTable(returns) {
+function generateDrawdownTable(returns, cleanReturns = null) {
   if (!returns || !returns.values || !returns.index) {
     return `<table>
       <thead>
@@ -2633,7 +2653,7 @@ function generateDrawdownTable(returns) {
 
   try {
     // Calculate actual drawdown periods
-    const cleanReturns = utils.prepareReturns(returns.values, 0, false);
+    cleanReturns = cleanReturns || utils.prepareReturns(returns.values, 0, false);
     const ddDetails = utils.drawdownDetails(cleanReturns, returns.index);
     
     let tableRows = '';
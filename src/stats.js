@@ -5,9 +5,12 @@
 
 import { 
   prepareReturns, 
+  looksLikePrices,
   toDrawdownSeries, 
   aggregateReturns,
   makePosNeg,
+  sumSquaredDeviations,
+  selectKth,
   normalInverseCDF,
   getPeriodicReturns,
   monthToDateReturns,
@@ -24,31 +27,6 @@ import {
 const TRADING_DAYS_PER_YEAR = 252;
 const TRADING_DAYS_PER_MONTH = 21;
 
-/**
- * Convert returns to prices
- * Exactly matches Python to_prices function
- * @param {Array} returns - Returns array
- * @param {number} base - Base price (default 100000)
- * @returns {Array} Price series
- */
-function toPrices(returns, base = 100000) {
-  if (returns.length === 0) {
-    return [];
-  }
-  
-  // Python: base + base * compsum(returns)
-  // where compsum(returns) = returns.add(1).cumprod() - 1
-  const prices = [base];
-  let cumulative = 1;
-  
-  for (let i = 0; i < returns.length; i++) {
-    cumulative *= (1 + returns[i]);
-    prices.push(base + base * (cumulative - 1));
-  }
-  
-  return prices.slice(1); // Remove the initial base value
-}
-
 /**
  * Calculate total compounded returns
  * Exactly matches Python comp() function
@@ -125,7 +103,7 @@ export function sharpe(returns, rfRate = 0, nans = false) {
   const mean = cleanReturns.reduce((sum, ret) => sum + ret, 0) / cleanReturns.length;
   
   // Use sample standard deviation (ddof=1) like Python
-  const variance = cleanReturns.reduce((sum, ret) => sum + Math.pow(ret - mean, 2), 0) / (cleanReturns.length - 1);
+  const variance = sumSquaredDeviations(cleanReturns, mean) / (cleanReturns.length - 1);
   const std = Math.sqrt(variance);
   
   if (std === 0) {
@@ -165,7 +143,7 @@ export function sortino(returns, rfRate = 0, nans = false) {
   }
   
   // Use sample standard deviation approach (ddof=1 equivalent)
-  const downsideVariance = negativeReturns.reduce((sum, ret) => sum + Math.pow(ret, 2), 0) / (cleanReturns.length - 1);
+  const downsideVariance = sumSquaredDeviations(negativeReturns, 0) / (cleanReturns.length - 1);
   const downsideStd = Math.sqrt(downsideVariance);
   
   if (downsideStd === 0) {
@@ -218,7 +196,7 @@ export function volatility(returns, nans = false) {
   const mean = cleanReturns.reduce((sum, ret) => sum + ret, 0) / cleanReturns.length;
   
   // Use sample standard deviation (ddof=1) like Python
-  const variance = cleanReturns.reduce((sum, ret) => sum + Math.pow(ret - mean, 2), 0) / (cleanReturns.length - 1);
+  const variance = sumSquaredDeviations(cleanReturns, mean) / (cleanReturns.length - 1);
   const std = Math.sqrt(variance);
   
   // Annualized volatility
@@ -246,26 +224,26 @@ export function maxDrawdown(returns, nans = false) {
     return 0;
   }
   
-  // Convert returns to prices like Python's _prepare_prices
-  const prices = toPrices(cleanReturns);
-  
-  // Calculate expanding max and drawdown like Python
   // Python: (prices / prices.expanding(min_periods=0).max()).min() - 1
-  const expandingMax = [];
-  let currentMax = prices[0];
+  // Prices (like Python's _prepare_prices), running max and minimum
+  // drawdown are tracked in one scan instead of materializing each series
+  const base = 100000;
+  let cumulative = 1;
+  let currentMax = -Infinity;
+  let minDrawdown = Infinity;
   
-  for (let i = 0; i < prices.length; i++) {
-    if (prices[i] > currentMax) {
-      currentMax = prices[i];
+  for (let i = 0; i < cleanReturns.length; i++) {
+    cumulative *= (1 + cleanReturns[i]);
+    const price = base + base * (cumulative - 1);
+    
+    if (i === 0 || price > currentMax) {
+      currentMax = price;
     }
-    expandingMax.push(currentMax);
+    
+    minDrawdown = Math.min(minDrawdown, price / currentMax - 1);
   }
   
-  // Calculate drawdown series
-  const drawdowns = prices.map((price, i) => price / expandingMax[i] - 1);
-  
-  // Return minimum drawdown
-  return Math.min(...drawdowns);
+  return minDrawdown;
 }
 
 /**
@@ -485,9 +463,19 @@ export function valueAtRisk(returns, sigma = 1, confidence = 0.95, nans = false)
   }
   
   // Calculate mean and standard deviation (use ddof=1 like Python pandas)
-  const mu = cleanReturns.reduce((sum, val) => sum + val, 0) / cleanReturns.length;
-  const variance = cleanReturns.reduce((sum, val) => sum + Math.pow(val - mu, 2), 0) / (cleanReturns.length - 1);
-  const std = Math.sqrt(variance);
+  const moments = centralMoments(cleanReturns);
+  return parametricVar(moments.mean, Math.sqrt(moments.m2 / (moments.n - 1)), sigma, confidence);
+}
+
+/**
+ * Variance-covariance VaR for a given mean and standard deviation
+ * @param {number} mu - Mean of returns
+ * @param {number} std - Sample standard deviation of returns
+ * @param {number} sigma - Sigma multiplier
+ * @param {number} confidence - Confidence level
+ * @returns {number} Value at Risk
+ */
+function parametricVar(mu, std, sigma, confidence) {
   const sigmaStd = sigma * std;
   
   // Convert confidence to appropriate format if needed
@@ -526,91 +514,155 @@ export function valueAtRisk(returns, sigma = 1, confidence = 0.95, nans = false)
 export function cvar(returns, sigma = 1, confidence = 0.95, nans = false) {
   const cleanReturns = prepareReturns(returns, 0, nans);
   
-  if (cleanReturns.length === 0) {
+  return conditionalVar(cleanReturns, sigma, confidence);
+}
+
+/**
+ * CVaR of an already prepared values array
+ * @param {Array} values - Prepared values array
+ * @param {number} sigma - Sigma multiplier
+ * @param {number} confidence - Confidence level
+ * @returns {number} Conditional Value at Risk
+ */
+function conditionalVar(values, sigma, confidence) {
+  if (values.length === 0) {
     return 0;
   }
   
   // First calculate VaR using variance-covariance method (Python implementation)
-  const var95 = valueAtRisk(returns, sigma, confidence, nans);
+  // from the already prepared returns rather than preparing them again
+  const moments = centralMoments(values);
+  const var95 = parametricVar(moments.mean, Math.sqrt(moments.m2 / (moments.n - 1)), sigma, confidence);
   
   // Python: returns[returns < var].values.mean()
-  const belowVar = cleanReturns.filter(ret => ret < var95);
+  const cVarResult = tailMean(values, var95);
   
-  if (belowVar.length === 0) {
-    return var95; // Return VaR if no returns below threshold
+  // Python: return c_var if ~np.isnan(c_var) else var
+  // (also covers the case of no returns below the threshold)
+  return !isNaN(cVarResult) ? cVarResult : var95;
+}
+
+/**
+ * Mean of the values strictly below a threshold
+ * Accumulated directly rather than through a filtered copy
+ * @param {Array} values - Values array
+ * @param {number} threshold - Upper bound (exclusive)
+ * @returns {number} Tail mean, NaN if no value is below the threshold
+ */
+function tailMean(values, threshold) {
+  let tailSum = 0;
+  let tailCount = 0;
+  
+  for (let i = 0; i < values.length; i++) {
+    if (values[i] < threshold) {
+      tailSum += values[i];
+      tailCount++;
+    }
   }
   
-  const cVarResult = belowVar.reduce((sum, ret) => sum + ret, 0) / belowVar.length;
+  return tailCount === 0 ? NaN : tailSum / tailCount;
+}
+
+/**
+ * Calculate count, mean and central moment sums in a single pass
+ * Welford/Terriberry online update instead of separate mean/std/power passes
+ * @param {Array} values - Values array
+ * @returns {Object} Count, mean and sums of 2nd, 3rd and 4th central moments
+ */
+function centralMoments(values) {
+  let n = 0;
+  let mean = 0;
+  let m2 = 0;
+  let m3 = 0;
+  let m4 = 0;
   
-  // Python: return c_var if ~np.isnan(c_var) else var
-  return !isNaN(cVarResult) ? cVarResult : var95;
+  for (let i = 0; i < values.length; i++) {
+    const n1 = n;
+    n++;
+    const delta = values[i] - mean;
+    const deltaN = delta / n;
+    const deltaN2 = deltaN * deltaN;
+    const term1 = delta * deltaN * n1;
+    
+    mean += deltaN;
+    m4 += term1 * deltaN2 * (n * n - 3 * n + 3) + 6 * deltaN2 * m2 - 4 * deltaN * m3;
+    m3 += term1 * deltaN * (n - 2) - 3 * deltaN * m2;
+    m2 += term1;
+  }
+  
+  return { n, mean, m2, m3, m4 };
 }
 
 /**
- * Calculate Skewness
- * Exactly matches Python implementation
- * @param {Array} returns - Returns array
- * @param {boolean} nans - Include NaN values (default false)
+ * Calculate bias-corrected skewness from central moments
+ * @param {Object} moments - Result of centralMoments()
  * @returns {number} Skewness
  */
-export function skew(returns, nans = false) {
-  const cleanReturns = prepareReturns(returns, 0, nans);
-  const n = cleanReturns.length;
-  
-  if (n <= 1) {
+function skewFromMoments({ n, m2, m3 }) {
+  if (n <= 2) {
     return 0;
   }
   
-  const mean = cleanReturns.reduce((sum, ret) => sum + ret, 0) / n;
   // Use sample standard deviation (divide by n-1)
-  const variance = cleanReturns.reduce((sum, ret) => sum + Math.pow(ret - mean, 2), 0) / (n - 1);
-  const std = Math.sqrt(variance);
+  const std = Math.sqrt(m2 / (n - 1));
   
   if (std === 0) {
     return 0;
   }
   
-  // Calculate sample skewness with bias correction
-  const skewness = cleanReturns.reduce((sum, ret) => sum + Math.pow((ret - mean) / std, 3), 0) / n;
-  
-  // Apply bias correction factor (matches pandas)
+  // Sample skewness with bias correction (matches pandas)
+  const skewness = m3 / n / (std * std * std);
   const biasCorrection = Math.sqrt(n * (n - 1)) / (n - 2);
   
-  return n <= 2 ? 0 : skewness * biasCorrection;
+  return skewness * biasCorrection;
 }
 
 /**
- * Calculate Kurtosis
- * Exactly matches Python implementation
- * @param {Array} returns - Returns array
- * @param {boolean} nans - Include NaN values (default false)
- * @returns {number} Kurtosis
+ * Calculate bias-corrected excess kurtosis from central moments
+ * @param {Object} moments - Result of centralMoments()
+ * @returns {number} Excess kurtosis
  */
-export function kurtosis(returns, nans = false) {
-  const cleanReturns = prepareReturns(returns, 0, nans);
-  const n = cleanReturns.length;
-  
-  if (n <= 1) {
+function kurtosisFromMoments({ n, m2, m4 }) {
+  if (n <= 3) {
     return 0;
   }
   
-  const mean = cleanReturns.reduce((sum, ret) => sum + ret, 0) / n;
   // Use sample standard deviation (divide by n-1)
-  const variance = cleanReturns.reduce((sum, ret) => sum + Math.pow(ret - mean, 2), 0) / (n - 1);
-  const std = Math.sqrt(variance);
+  const variance = m2 / (n - 1);
   
-  if (std === 0) {
+  if (variance === 0) {
     return 0;
   }
   
-  // Calculate sample kurtosis with bias correction
-  const kurtosis = cleanReturns.reduce((sum, ret) => sum + Math.pow((ret - mean) / std, 4), 0) / n;
-  
-  // Apply bias correction factor (matches pandas)
-  const biasCorrection = (n - 1) * ((n + 1) * kurtosis - 3 * (n - 1)) / ((n - 2) * (n - 3));
+  // Sample kurtosis with bias correction (matches pandas)
+  const kurtosis = m4 / n / (variance * variance);
   
   // Return excess kurtosis (pandas default)
-  return n <= 3 ? 0 : biasCorrection;
+  return (n - 1) * ((n + 1) * kurtosis - 3 * (n - 1)) / ((n - 2) * (n - 3));
+}
+
+/**
+ * Calculate Skewness
+ * Exactly matches Python implementation
+ * @param {Array} returns - Returns array
+ * @param {boolean} nans - Include NaN values (default false)
+ * @returns {number} Skewness
+ */
+export function skew(returns, nans = false) {
+  const cleanReturns = prepareReturns(returns, 0, nans);
+  return skewFromMoments(centralMoments(cleanReturns));
+}
+
+/**
+ * Calculate Kurtosis
+ * Exactly matches Python implementation
+ * @param {Array} returns - Returns array
+ * @param {boolean} nans - Include NaN values (default false)
+ * @returns {number} Kurtosis
+ */
+export function kurtosis(returns, nans = false) {
+  const cleanReturns = prepareReturns(returns, 0, nans);
+  return kurtosisFromMoments(centralMoments(cleanReturns));
 }
 
 /**
@@ -752,17 +804,23 @@ export function alpha(returns, benchmark, rfRate = 0, nans = false) {
  */
 export function ulcerIndex(returns, nans = false) {
   const cleanReturns = prepareReturns(returns, 0, nans);
-  const drawdowns = toDrawdownSeries(cleanReturns);
-  
+  return ulcerFromDrawdowns(toDrawdownSeries(cleanReturns));
+}
+
+/**
+ * Ulcer Index of an already computed drawdown series
+ * @param {Array} drawdowns - Drawdown series
+ * @returns {number} Ulcer Index
+ */
+function ulcerFromDrawdowns(drawdowns) {
   if (drawdowns.length === 0) {
     return 0;
   }
   
   // Python: np.sqrt(np.divide((dd**2).sum(), returns.shape[0] - 1))
-  const squaredDrawdowns = drawdowns.map(dd => Math.pow(dd, 2));
-  const sumSquaredDrawdowns = squaredDrawdowns.reduce((sum, sq) => sum + sq, 0);
+  const sumSquaredDrawdowns = sumSquaredDeviations(drawdowns, 0);
   
-  return Math.sqrt(sumSquaredDrawdowns / (cleanReturns.length - 1));
+  return Math.sqrt(sumSquaredDrawdowns / (drawdowns.length - 1));
 }
 
 /**
@@ -799,7 +857,7 @@ export function downsideDeviation(returns, nans = false) {
     return 0;
   }
   
-  const variance = negativeReturns.reduce((sum, ret) => sum + Math.pow(ret, 2), 0) / cleanReturns.length;
+  const variance = sumSquaredDeviations(negativeReturns, 0) / cleanReturns.length;
   return Math.sqrt(variance) * Math.sqrt(TRADING_DAYS_PER_YEAR);
 }
 
@@ -855,8 +913,7 @@ export function yearlyReturns(returns, nans = false, dates = null, compounded =
  */
 export function outliers(returns, quantile = 0.95, nans = false) {
   const cleanReturns = prepareReturns(returns, 0, nans);
-  const sorted = [...cleanReturns].sort((a, b) => a - b);
-  const threshold = sorted[Math.floor(sorted.length * quantile)];
+  const threshold = selectKth(cleanReturns, Math.floor(cleanReturns.length * quantile));
   return cleanReturns.filter(ret => ret > threshold);
 }
 
@@ -870,8 +927,7 @@ export function outliers(returns, quantile = 0.95, nans = false) {
  */
 export function removeOutliers(returns, quantile = 0.95, nans = false) {
   const cleanReturns = prepareReturns(returns, 0, nans);
-  const sorted = [...cleanReturns].sort((a, b) => a - b);
-  const threshold = sorted[Math.floor(sorted.length * quantile)];
+  const threshold = selectKth(cleanReturns, Math.floor(cleanReturns.length * quantile));
   return cleanReturns.filter(ret => ret < threshold);
 }
 
@@ -1085,6 +1141,24 @@ export function riskOfRuin(returns, nans = false) {
   return Math.pow((1 - wins) / (1 + wins), cleanReturns.length);
 }
 
+/**
+ * Check that every element is a finite number, i.e. that prepareReturns
+ * would not filter anything out (holes of sparse arrays count as missing)
+ * @param {Array} values - Values array
+ * @returns {boolean} True if no element would be removed
+ */
+function allFinite(values) {
+  for (let i = 0; i < values.length; i++) {
+    const val = values[i];
+    
+    if (typeof val !== 'number' || !isFinite(val)) {
+      return false;
+    }
+  }
+  
+  return true;
+}
+
 /**
  * Calculate serenity index
  * Exactly matches Python implementation
@@ -1099,22 +1173,36 @@ export function serenityIndex(returns, rfRate = 0, nans = false) {
   // Get drawdown series from original returns
   const drawdowns = toDrawdownSeries(returns);
   
-  // Calculate pitfall = -cvar(dd) / returns.std()
-  const cvarDD = cvar(drawdowns, 1, 0.95, nans); // CVaR of drawdowns
+  // CVaR of drawdowns
+  const cvarDD = cvar(drawdowns, 1, 0.95, nans);
+  
+  // Ulcer index as ulcerIndex() computes it, from the prepared returns; when
+  // preparing would leave them unchanged (nothing to filter, not prices),
+  // their drawdowns are the series above
+  const unchanged = !looksLikePrices(returns) && (nans || allFinite(returns));
+  const ulcer = ulcerFromDrawdowns(
+    unchanged ? drawdowns : toDrawdownSeries(prepareReturns(returns, 0, nans))
+  );
+  
+  // Sum of original returns, reused for the mean below
+  // (reduce skips the holes of sparse arrays, so they are counted as well)
+  let presentCount = 0;
+  const returnsSum = returns.reduce((sum, ret) => {
+    presentCount++;
+    return sum + ret;
+  }, 0);
+  
+  // The squared deviations skip holes too, so compact sparse input first
+  const presentReturns = presentCount === returns.length ? returns : returns.filter(() => true);
   
   // Calculate sample standard deviation (ddof=1, pandas default)
-  const returnsMean = returns.reduce((sum, ret) => sum + ret, 0) / returns.length;
-  const sampleVariance = returns.reduce((sum, ret) => sum + Math.pow(ret - returnsMean, 2), 0) / (returns.length - 1); // N-1 denominator
+  const returnsMean = returnsSum / returns.length;
+  const sampleVariance = sumSquaredDeviations(presentReturns, returnsMean) / (returns.length - 1); // N-1 denominator
   const returnsStd = Math.sqrt(sampleVariance);
   
+  // Calculate pitfall = -cvar(dd) / returns.std()
   const pitfall = -cvarDD / returnsStd;
   
-  // Calculate ulcer index from original returns
-  const ulcer = ulcerIndex(returns, nans);
-  
-  // Calculate sum of original returns
-  const returnsSum = returns.reduce((sum, ret) => sum + ret, 0);
-  
   if (ulcer === 0 || pitfall === 0) {
     return 0;
   }
@@ -1206,7 +1294,7 @@ export function informationRatio(returns, benchmark, nans = false) {
   
   // Calculate mean and standard deviation of excess returns
   const mean = excessReturns.reduce((sum, ret) => sum + ret, 0) / excessReturns.length;
-  const variance = excessReturns.reduce((sum, ret) => sum + Math.pow(ret - mean, 2), 0) / (excessReturns.length - 1);
+  const variance = sumSquaredDeviations(excessReturns, mean) / (excessReturns.length - 1);
   const std = Math.sqrt(variance);
   
   return std === 0 ? 0 : mean / std;
@@ -1297,7 +1385,7 @@ export function smartSharpe(returns, rfRate = 0, periods = 252, nans = false) {
   
   // Python: divisor = divisor * autocorr_penalty(returns)
   const meanReturn = cleanReturns.reduce((sum, ret) => sum + ret, 0) / cleanReturns.length;
-  const variance = cleanReturns.reduce((sum, ret) => sum + Math.pow(ret - meanReturn, 2), 0) / (cleanReturns.length - 1);
+  const variance = sumSquaredDeviations(cleanReturns, meanReturn) / (cleanReturns.length - 1);
   const stdDev = Math.sqrt(variance);
   const penalty = autocorrPenalty(cleanReturns, nans);
   const adjustedStdDev = stdDev * penalty;
@@ -1334,7 +1422,7 @@ export function smartSortino(returns, rfRate = 0, periods = 252, nans = false) {
     return Infinity;
   }
   
-  const downsideVariance = negativeReturns.reduce((sum, ret) => sum + Math.pow(ret, 2), 0) / cleanReturns.length;
+  const downsideVariance = sumSquaredDeviations(negativeReturns, 0) / cleanReturns.length;
   const downsideStd = Math.sqrt(downsideVariance);
   const penalty = autocorrPenalty(cleanReturns, nans);
   const adjustedDownsideStd = downsideStd * penalty;
@@ -1389,7 +1477,7 @@ export function probabilisticRatio(returns, benchmark, periods = 252, nans = fal
   
   const excessReturns = cleanReturns.map((ret, i) => ret - cleanBenchmark[i]);
   const mean = excessReturns.reduce((sum, ret) => sum + ret, 0) / excessReturns.length;
-  const variance = excessReturns.reduce((sum, ret) => sum + Math.pow(ret - mean, 2), 0) / (excessReturns.length - 1);
+  const variance = sumSquaredDeviations(excessReturns, mean) / (excessReturns.length - 1);
   const std = Math.sqrt(variance);
   
   if (std === 0) return 0;
@@ -1405,34 +1493,93 @@ export function probabilisticRatio(returns, benchmark, periods = 252, nans = fal
 
 /**
  * Normal cumulative distribution function
+ * Uses erfc so both tails keep full relative precision (like scipy's ndtr)
  * @param {number} x - Input value
  * @returns {number} CDF value
  */
-function normalCDF(x) {
-  return 0.5 * (1 + erf(x / Math.sqrt(2)));
+export function normalCDF(x) {
+  return 0.5 * erfc(-x / Math.SQRT2);
 }
 
+// Series is used below this |x|, continued fraction above it
+const ERF_SERIES_CUTOFF = 1.5;
+const ERF_SERIES_TERMS = 25;
+const ERFC_CONTFRAC_CUTOFF = 30;
+const ERFC_CONTFRAC_TERMS = 50;
+const SQRT_PI = Math.sqrt(Math.PI);
+
 /**
- * Error function approximation
+ * Power series for erf, accurate for small |x|
  * @param {number} x - Input value
  * @returns {number} Error function value
  */
-function erf(x) {
-  // Abramowitz and Stegun approximation
-  const a1 = 0.254829592;
-  const a2 = -0.284496736;
-  const a3 = 1.421413741;
-  const a4 = -1.453152027;
-  const a5 = 1.061405429;
-  const p = 0.3275911;
+function erfSeries(x) {
+  const x2 = x * x;
+  let acc = 0;
+  let fk = ERF_SERIES_TERMS + 0.5;
+  
+  for (let i = 0; i < ERF_SERIES_TERMS; i++) {
+    acc = 2 + x2 * acc / fk;
+    fk -= 1;
+  }
+  
+  return acc * x * Math.exp(-x2) / SQRT_PI;
+}
+
+/**
+ * Continued fraction for erfc, accurate for larger positive x
+ * @param {number} x - Input value (x >= ERF_SERIES_CUTOFF)
+ * @returns {number} Complementary error function value
+ */
+function erfcContinuedFraction(x) {
+  if (x >= ERFC_CONTFRAC_CUTOFF) {
+    return 0;
+  }
+  
+  const x2 = x * x;
+  let a = 0;
+  let da = 0.5;
+  let p = 1;
+  let pLast = 0;
+  let q = da + x2;
+  let qLast = 1;
+  
+  for (let i = 0; i < ERFC_CONTFRAC_TERMS; i++) {
+    a += da;
+    da += 2;
+    const b = da + x2;
+    
+    let temp = p;
+    p = b * p - a * pLast;
+    pLast = temp;
+    
+    temp = q;
+    q = b * q - a * qLast;
+    qLast = temp;
+  }
+  
+  return p / q * x * Math.exp(-x2) / SQRT_PI;
+}
+
+/**
+ * Complementary error function
+ * Double-precision replacement for the Abramowitz and Stegun approximation
+ * @param {number} x - Input value
+ * @returns {number} Complementary error function value
+ */
+function erfc(x) {
+  if (isNaN(x)) {
+    return NaN;
+  }
   
-  const sign = x < 0 ? -1 : 1;
-  x = Math.abs(x);
+  const absX = Math.abs(x);
   
-  const t = 1.0 / (1.0 + p * x);
-  const y = 1.0 - (((((a5 * t + a4) * t) + a3) * t + a2) * t + a1) * t * Math.exp(-x * x);
+  if (absX < ERF_SERIES_CUTOFF) {
+    return 1 - erfSeries(x);
+  }
   
-  return sign * y;
+  const cf = erfcContinuedFraction(absX);
+  return x > 0 ? cf : 2 - cf;
 }
 
 /**
@@ -1448,22 +1595,28 @@ export function probabilisticSharpeRatio(returns, rfRate = 0, periods = 252, nan
   // Don't adjust returns by rfRate - let Python handle rf subtraction in ratio calculation
   const cleanReturns = prepareReturns(returns, 0, nans);
   
+  // Mean, std, skew and kurtosis all come from one pass over the data
+  return psrFromMoments(centralMoments(cleanReturns), rfRate);
+}
+
+/**
+ * Probabilistic Sharpe ratio from central moments of the returns
+ * @param {Object} moments - Result of centralMoments()
+ * @param {number} rfRate - Risk-free rate
+ * @returns {number} Probabilistic Sharpe ratio
+ */
+function psrFromMoments(moments, rfRate) {
+  const n = moments.n;
+  
   // Python: base = sharpe(series, periods=periods, annualize=False, smart=smart)
   // We need NON-ANNUALIZED Sharpe ratio!
-  const mean = cleanReturns.reduce((sum, ret) => sum + ret, 0) / cleanReturns.length;
-  const variance = cleanReturns.reduce((sum, ret) => sum + Math.pow(ret - mean, 2), 0) / (cleanReturns.length - 1);
-  const std = Math.sqrt(variance);
-  const baseSharpe = std === 0 ? 0 : mean / std; // NON-annualized Sharpe
+  const std = Math.sqrt(moments.m2 / (n - 1));
+  const baseSharpe = std === 0 ? 0 : moments.mean / std; // NON-annualized Sharpe
   
-  const skewVal = skew(cleanReturns, nans);
-  const kurtosisVal = kurtosis(cleanReturns, nans);
-  const n = cleanReturns.length;
+  const skewVal = skewFromMoments(moments);
+  const kurtosisVal = kurtosisFromMoments(moments);
   
-  // Python formula from probabilistic_ratio function
-  const sigmaSr = Math.sqrt(
-    (1 + (0.5 * Math.pow(baseSharpe, 2)) - (skewVal * baseSharpe) + 
-     (((kurtosisVal - 3) / 4) * Math.pow(baseSharpe, 2))) / (n - 1)
-  );
+  const sigmaSr = sharpeStandardError(baseSharpe, skewVal, kurtosisVal, n);
   
   // Python: ratio = (base - rf) / sigma_sr
   const ratio = (baseSharpe - rfRate) / sigmaSr;
@@ -1472,6 +1625,59 @@ export function probabilisticSharpeRatio(returns, rfRate = 0, periods = 252, nan
   return psr;
 }
 
+/**
+ * Standard error of a (non-annualized) Sharpe ratio estimate
+ * Python: sqrt((1 + 0.5*sr^2 - skew*sr + ((kurt - 3) / 4) * sr^2) / (n - 1)),
+ * evaluated in Horner form since 0.5 + (kurt - 3) / 4 = (kurt - 1) / 4
+ * @param {number} sharpeRatio - Non-annualized Sharpe ratio
+ * @param {number} skewVal - Skewness of returns
+ * @param {number} kurtosisVal - Kurtosis of returns
+ * @param {number} n - Number of observations
+ * @returns {number} Standard error of the Sharpe ratio
+ */
+function sharpeStandardError(sharpeRatio, skewVal, kurtosisVal, n) {
+  const inner = 1 + sharpeRatio * (sharpeRatio * (kurtosisVal - 1) / 4 - skewVal);
+  
+  // A large skew with thin tails can push the variance estimate below zero;
+  // clamp it rather than returning NaN from the square root
+  return Math.sqrt(Math.max(inner, 0) / (n - 1));
+}
+
+/**
+ * Calculate the core return and risk statistics in one go
+ * Moments and the drawdown series are computed once and every derived
+ * statistic is read from them, so report views can share the result
+ * instead of recomputing each metric from the returns
+ * @param {Array} returns - Returns array
+ * @param {boolean} nans - Include NaN values (default false)
+ * @returns {Object} Core statistics
+ */
+export function coreStatistics(returns, nans = false) {
+  const cleanReturns = prepareReturns(returns, 0, nans);
+  const moments = centralMoments(cleanReturns);
+  const n = moments.n;
+  const std = Math.sqrt(moments.m2 / (n - 1));
+  const drawdowns = toDrawdownSeries(cleanReturns);
+  
+  // Same empty-input conventions as valueAtRisk() and cvar()
+  const var95 = n === 0 ? 0 : parametricVar(moments.mean, std, 1, 0.95);
+  const cVarResult = n === 0 ? 0 : tailMean(cleanReturns, var95);
+  
+  return {
+    returns: cleanReturns,
+    n,
+    mean: moments.mean,
+    std,
+    skew: skewFromMoments(moments),
+    kurtosis: kurtosisFromMoments(moments),
+    drawdowns,
+    ulcerIndex: ulcerFromDrawdowns(drawdowns),
+    valueAtRisk: var95,
+    cvar: !isNaN(cVarResult) ? cVarResult : var95,
+    probabilisticSharpeRatio: psrFromMoments(moments, 0)
+  };
+}
+
 /**
  * Calculate probabilistic Sortino ratio
  * Exactly matches Python implementation
@@ -1539,12 +1745,9 @@ export function tailRatio(returns, cutoff = 0.95, nans = false) {
   }
   
   // Python: abs(returns.quantile(cutoff) / returns.quantile(1 - cutoff))
-  const sorted = [...cleanReturns].sort((a, b) => a - b);
-  const rightQuantileIndex = Math.floor(sorted.length * cutoff);
-  const leftQuantileIndex = Math.floor(sorted.length * (1 - cutoff));
-  
-  const rightQuantile = sorted[rightQuantileIndex] || sorted[sorted.length - 1];
-  const leftQuantile = sorted[leftQuantileIndex] || sorted[0];
+  const n = cleanReturns.length;
+  const rightQuantile = selectKth(cleanReturns, Math.floor(n * cutoff)) || selectKth(cleanReturns, n - 1);
+  const leftQuantile = selectKth(cleanReturns, Math.floor(n * (1 - cutoff))) || selectKth(cleanReturns, 0);
   
   return leftQuantile === 0 ? 0 : Math.abs(rightQuantile / leftQuantile);
 }
@@ -1647,8 +1850,7 @@ export function outlierWinRatio(returns, quantile = 0.99, nans = false) {
   }
   
   // Python: returns.quantile(quantile).mean() / returns[returns >= 0].mean()
-  const sorted = [...cleanReturns].sort((a, b) => a - b);
-  const quantileValue = sorted[Math.floor(sorted.length * quantile)];
+  const quantileValue = selectKth(cleanReturns, Math.floor(cleanReturns.length * quantile));
   const meanPositive = positiveReturns.reduce((sum, ret) => sum + ret, 0) / positiveReturns.length;
   
   return meanPositive === 0 ? 0 : quantileValue / meanPositive;
@@ -1671,8 +1873,7 @@ export function outlierLossRatio(returns, quantile = 0.01, nans = false) {
   }
   
   // Python: returns.quantile(quantile).mean() / returns[returns < 0].mean()
-  const sorted = [...cleanReturns].sort((a, b) => a - b);
-  const quantileValue = sorted[Math.floor(sorted.length * quantile)];
+  const quantileValue = selectKth(cleanReturns, Math.floor(cleanReturns.length * quantile));
   const meanNegative = negativeReturns.reduce((sum, ret) => sum + ret, 0) / negativeReturns.length;
   
   return meanNegative === 0 ? 0 : quantileValue / meanNegative;
@@ -24,39 +24,53 @@ export function prepareReturns(data, rfRate = 0, nans = false) {
     return [];
   }
 
-  let returns = [...data];
-  
   // If data looks like prices (always positive, large values), convert to returns
-  const validValues = returns.filter(val => 
-    val !== null && 
-    val !== undefined && 
-    !isNaN(val) && 
-    isFinite(val) && 
-    typeof val === 'number'
-  );
-  
-  if (validValues.length > 1 && validValues.every(val => val > 0) && Math.min(...validValues) > 1) {
-    returns = toReturns(returns);
+  const source = looksLikePrices(data) ? toReturns(data) : data;
+  const dailyRf = rfRate !== 0 ? Math.pow(1 + rfRate, 1/TRADING_DAYS_PER_YEAR) - 1 : 0;
+  
+  // Filtering and risk-free adjustment share one pass and one output array
+  const returns = [];
+  
+  for (let i = 0; i < source.length; i++) {
+    const val = source[i];
+    
+    // Remove NaN values unless explicitly requested
+    if (!nans && (typeof val !== 'number' || !isFinite(val))) {
+      continue;
+    }
+    
+    // Subtract risk-free rate
+    returns.push(rfRate !== 0 ? val - dailyRf : val);
   }
 
-  // Remove NaN values unless explicitly requested
-  if (!nans) {
-    returns = returns.filter(val => 
-      val !== null && 
-      val !== undefined && 
-      !isNaN(val) && 
-      isFinite(val) && 
-      typeof val === 'number'
-    );
-  }
+  return returns;
+}
 
-  // Subtract risk-free rate
-  if (rfRate !== 0) {
-    const dailyRf = Math.pow(1 + rfRate, 1/TRADING_DAYS_PER_YEAR) - 1;
-    returns = returns.map(ret => ret - dailyRf);
+/**
+ * Check whether data looks like prices rather than returns
+ * True when there are at least two valid values and every one is above 1,
+ * decided in a single scan that stops at the first value that is not
+ * @param {Array} data - Price or returns data
+ * @returns {boolean} True if data should be treated as prices
+ */
+export function looksLikePrices(data) {
+  let validCount = 0;
+  
+  for (let i = 0; i < data.length; i++) {
+    const val = data[i];
+    
+    if (typeof val !== 'number' || !isFinite(val)) {
+      continue;
+    }
+    
+    if (val <= 1) {
+      return false;
+    }
+    
+    validCount++;
   }
-
-  return returns;
+  
+  return validCount > 1;
 }
 
 /**
@@ -103,35 +117,26 @@ export function toDrawdownSeries(returns) {
     throw new Error('Returns must be an array');
   }
 
-  const cumReturns = [];
+  // Single scan: running wealth index and its running peak (cummax)
+  const drawdowns = [];
   let cumReturn = 1;
+  let peak = returns.length > 0 && !isNaN(returns[0]) ? (1 + returns[0]) || 1 : 1;
   
-  // Calculate cumulative returns
-  for (const ret of returns) {
+  for (let i = 0; i < returns.length; i++) {
+    const ret = returns[i];
+    
     if (isNaN(ret)) {
-      cumReturns.push(NaN);
-      continue;
-    }
-    cumReturn *= (1 + ret);
-    cumReturns.push(cumReturn);
-  }
-  
-  // Calculate drawdowns
-  const drawdowns = [];
-  let peak = cumReturns[0] || 1;
-  
-  for (const cumRet of cumReturns) {
-    if (isNaN(cumRet)) {
       drawdowns.push(NaN);
       continue;
     }
     
-    if (cumRet > peak) {
-      peak = cumRet;
+    cumReturn *= (1 + ret);
+    
+    if (cumReturn > peak) {
+      peak = cumReturn;
     }
     
-    const drawdown = (cumRet / peak) - 1;
-    drawdowns.push(drawdown);
+    drawdowns.push((cumReturn / peak) - 1);
   }
   
   return drawdowns;
@@ -317,8 +322,7 @@ export function toDrawdownsTable(returns) {
  * @returns {Array} Returns without outliers
  */
 function removeOutliers(returns, quantile = 0.95) {
-  const sorted = [...returns].sort((a, b) => a - b);
-  const threshold = sorted[Math.floor(sorted.length * quantile)];
+  const threshold = selectKth(returns, Math.floor(returns.length * quantile));
   return returns.filter(ret => ret < threshold);
 }
 
@@ -519,6 +523,87 @@ export function makePosNeg(returns) {
   return { positive, negative };
 }
 
+/**
+ * Sum of squared deviations from the mean
+ * Shared by the sample (n-1) and population (n) variance calculations.
+ * Uses Neumaier compensated summation to keep rounding error independent
+ * of series length
+ * @param {Array} values - Values array
+ * @param {number} mean - Mean of the values
+ * @param {number} start - First index to include (default 0)
+ * @param {number} end - Index to stop before (default values.length)
+ * @returns {number} Sum of (value - mean)^2
+ */
+export function sumSquaredDeviations(values, mean, start = 0, end = values.length) {
+  let sumSq = 0;
+  let compensation = 0;
+  
+  for (let i = start; i < end; i++) {
+    const diff = values[i] - mean;
+    const term = diff * diff;
+    const total = sumSq + term;
+    
+    if (Math.abs(sumSq) >= term) {
+      compensation += (sumSq - total) + term;
+    } else {
+      compensation += (term - total) + sumSq;
+    }
+    
+    sumSq = total;
+  }
+  
+  return sumSq + compensation;
+}
+
+/**
+ * k-th smallest value (0-based), i.e. sorted[k] without a full sort
+ * Quickselect on a copy, so the input order is left untouched
+ * @param {Array} values - Values array
+ * @param {number} k - Rank of the value to select
+ * @returns {number|undefined} sorted[k], or undefined if k is out of range
+ */
+export function selectKth(values, k) {
+  if (!(k >= 0 && k < values.length)) {
+    return undefined;
+  }
+  
+  const arr = values.slice();
+  let left = 0;
+  let right = arr.length - 1;
+  
+  while (left < right) {
+    // Median-of-three pivot guards against sorted input
+    const mid = (left + right) >> 1;
+    const pivot = Math.max(Math.min(arr[left], arr[mid]),
+      Math.min(Math.max(arr[left], arr[mid]), arr[right]));
+    let i = left;
+    let j = right;
+    
+    while (i <= j) {
+      while (arr[i] < pivot) i++;
+      while (arr[j] > pivot) j--;
+      
+      if (i <= j) {
+        const tmp = arr[i];
+        arr[i] = arr[j];
+        arr[j] = tmp;
+        i++;
+        j--;
+      }
+    }
+    
+    if (k <= j) {
+      right = j;
+    } else if (k >= i) {
+      left = i;
+    } else {
+      break;
+    }
+  }
+  
+  return arr[k];
+}
+
 /**
  * Convert returns to prices
  * Exactly matches Python implementation
@@ -601,7 +686,8 @@ export function exponentialStdev(returns, window = 30, isHalflife = false) {
       ewmvar = 0;
     } else {
       ewma = alpha * ret + (1 - alpha) * ewma;
-      ewmvar = alpha * Math.pow(ret - ewma, 2) + (1 - alpha) * ewmvar;
+      const diff = ret - ewma;
+      ewmvar = alpha * diff * diff + (1 - alpha) * ewmvar;
     }
     
     result.push(Math.sqrt(ewmvar));
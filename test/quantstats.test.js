@@ -5,7 +5,11 @@
 
 import { test, describe } from 'node:test';
 import { strict as assert } from 'node:assert';
+import { mkdtempSync, readdirSync, readFileSync, rmSync, writeFileSync } from 'node:fs';
+import { tmpdir } from 'node:os';
+import { join } from 'node:path';
 import * as qs from '../index.js';
+import { cachedCoreStatistics } from '../src/cache.js';
 
 describe('QuantStats.js Tests', () => {
   // Test data: Simple returns series for validation
@@ -58,6 +62,19 @@ describe('QuantStats.js Tests', () => {
       assert.equal(drawdowns[0], 0);
     });
 
+    test('selectKth should match indexing into the sorted array', () => {
+      const values = [...testReturns];
+      const sorted = [...testReturns].sort((a, b) => a - b);
+
+      for (let k = 0; k < sorted.length; k++) {
+        assert.equal(qs.utils.selectKth(values, k), sorted[k]);
+      }
+
+      // Input order must be preserved
+      assert.deepEqual(values, testReturns);
+      assert.equal(qs.utils.selectKth(values, values.length), undefined);
+    });
+
     test('portfolioValue should calculate cumulative value correctly', () => {
       const values = qs.utils.portfolioValue(testReturns, 1000);
       
@@ -155,6 +172,92 @@ describe('QuantStats.js Tests', () => {
       assert.equal(Math.abs(beta - 1) < 0.1, true);
     });
 
+    test('coreStatistics should agree with the individual metrics', () => {
+      const core = qs.stats.coreStatistics(testReturns);
+      
+      assert.equal(Math.abs(core.skew - qs.stats.skew(testReturns)) < 1e-12, true);
+      assert.equal(Math.abs(core.kurtosis - qs.stats.kurtosis(testReturns)) < 1e-12, true);
+      assert.equal(Math.abs(core.ulcerIndex - qs.stats.ulcerIndex(testReturns)) < 1e-12, true);
+      assert.equal(Math.abs(core.valueAtRisk - qs.stats.valueAtRisk(testReturns)) < 1e-12, true);
+      assert.equal(Math.abs(core.cvar - qs.stats.cvar(testReturns)) < 1e-12, true);
+      assert.deepEqual(core.drawdowns, qs.utils.toDrawdownSeries(testReturns));
+    });
+
+    test('cachedCoreStatistics should read back what it computed', () => {
+      const tempDir = mkdtempSync(join(tmpdir(), 'quantstats-'));
+      const cacheDir = join(tempDir, 'cache');
+      const scalars = ({ returns, drawdowns, ...rest }) => rest;
+      
+      // Long enough to be cached; NaNs kept with nans=true give NaN statistics
+      const longReturns = Array.from({ length: 2400 }, (_, i) => testReturns[i % testReturns.length]);
+      const withNaN = longReturns.map((ret, i) => i === 7 ? NaN : ret);
+      
+      try {
+        const expected = scalars(qs.stats.coreStatistics(longReturns));
+        assert.deepEqual(cachedCoreStatistics(longReturns, false, cacheDir), expected);
+        assert.deepEqual(cachedCoreStatistics(longReturns, false, cacheDir), expected);
+        
+        // Non-finite results must survive the round trip
+        cachedCoreStatistics(withNaN, true, cacheDir);
+        assert.equal(Number.isNaN(cachedCoreStatistics(withNaN, true, cacheDir).mean), true);
+        assert.equal(readdirSync(cacheDir).length, 2);
+        
+        // Incomplete or foreign entries are recomputed and rewritten
+        for (const entry of readdirSync(cacheDir)) {
+          writeFileSync(join(cacheDir, entry), '{"n":1}');
+        }
+        assert.deepEqual(cachedCoreStatistics(longReturns, false, cacheDir), expected);
+        assert.equal(readdirSync(cacheDir).some(entry => readFileSync(join(cacheDir, entry), 'utf8').includes('"mean"')), true);
+        
+        // Short series are computed directly, without an entry
+        assert.deepEqual(cachedCoreStatistics(testReturns, false, cacheDir), scalars(qs.stats.coreStatistics(testReturns)));
+        assert.equal(readdirSync(cacheDir).length, 2);
+        
+        // A cache directory that cannot be created must not fail the calculation
+        writeFileSync(join(tempDir, 'file'), '');
+        assert.deepEqual(cachedCoreStatistics(longReturns, false, join(tempDir, 'file', 'sub')), expected);
+      } finally {
+        rmSync(tempDir, { recursive: true, force: true });
+      }
+    });
+
+    test('serenityIndex should match the Python formula on every input path', () => {
+      // Python: (returns.sum() - rf) / (ulcer_index(returns) * -cvar(dd) / returns.std())
+      const referenceSerenity = (returns, nans) => {
+        const sum = returns.reduce((acc, ret) => acc + ret, 0);
+        const mean = sum / returns.length;
+        const variance = returns.reduce((acc, ret) => acc + (ret - mean) * (ret - mean), 0) / (returns.length - 1);
+        const pitfall = -qs.stats.cvar(qs.utils.toDrawdownSeries(returns), 1, 0.95, nans) / Math.sqrt(variance);
+        const ulcer = qs.stats.ulcerIndex(returns, nans);
+        return ulcer === 0 || pitfall === 0 ? 0 : sum / (ulcer * pitfall);
+      };
+      const close = (actual, expected) =>
+        Object.is(actual, expected) || Math.abs(actual - expected) <= 1e-12 * Math.max(1, Math.abs(expected));
+      
+      const inputs = {
+        clean: testReturns,
+        withNaN: testReturns.map((ret, i) => i % 7 === 3 ? NaN : ret),
+        withNull: testReturns.map((ret, i) => i % 7 === 3 ? null : ret),
+        // Raw values above 1 never draw down, so this path must come out as 0
+        priceLike: testPrices
+      };
+      
+      for (const [name, returns] of Object.entries(inputs)) {
+        for (const nans of [false, true]) {
+          const actual = qs.stats.serenityIndex(returns, 0, nans);
+          const expected = referenceSerenity(returns, nans);
+          assert.equal(close(actual, expected), true, `${name} (nans=${nans}): ${actual} vs ${expected}`);
+        }
+      }
+    });
+
+    test('serenityIndex should skip the holes of sparse arrays', () => {
+      // Holes count towards the length but not the sum or the variance
+      const sparseReturns = [, 0.01, , -0.02];
+      
+      assert.equal(Math.abs(qs.stats.serenityIndex(sparseReturns) - (-0.18664666796935742)) < 1e-12, true);
+    });
+
     test('kelly should calculate Kelly criterion correctly', () => {
       const kellyCriterion = qs.stats.kelly(testReturns);
       
@@ -195,6 +298,51 @@ describe('QuantStats.js Tests', () => {
       assert.equal(Math.abs(vol) < 1e-15, true);
     });
 
+    test('higher moments of constant returns should be zero', () => {
+      const constantReturns = [0.05, 0.05, 0.05, 0.05, 0.05];
+
+      // No dispersion means no skew and no excess kurtosis
+      assert.equal(qs.stats.skew(constantReturns), 0);
+      assert.equal(qs.stats.kurtosis(constantReturns), 0);
+    });
+
+    test('probabilistic Sharpe ratio of zero-mean returns should be one half', () => {
+      const symmetricReturns = [0.01, -0.01, 0.02, -0.02, 0.03, -0.03];
+      const psr = qs.stats.probabilisticSharpeRatio(symmetricReturns);
+      
+      // Zero Sharpe sits exactly at the median of the normal CDF
+      assert.equal(Math.abs(psr - 0.5) < 1e-12, true);
+    });
+
+    test('normalCDF should match reference values across the erfc branches', () => {
+      // Reference values from Python's 0.5 * math.erfc(-x / sqrt(2)); the
+      // series / continued fraction switch sits at |x| = 1.5 * sqrt(2) ~ 2.1213
+      const reference = [
+        [-8, 6.22096057427178e-16],
+        [-5, 2.866515718791946e-07],
+        [-2.15, 0.015777607391090517],
+        [-2.1, 0.017864420562816563],
+        [-1, 0.15865525393145707],
+        [0.5, 0.6914624612740131],
+        [2.1, 0.9821355794371834],
+        [2.15, 0.9842223926089095],
+        [3, 0.9986501019683699]
+      ];
+
+      for (const [x, expected] of reference) {
+        const actual = qs.stats.normalCDF(x);
+        assert.equal(Math.abs(actual - expected) <= 1e-13 * expected, true, `normalCDF(${x}) = ${actual}, expected ${expected}`);
+      }
+    });
+
+    test('probabilistic Sharpe ratio should stay defined for high-Sharpe short series', () => {
+      // Sharpe ratio far above 1 with thin tails drives the variance estimate negative
+      const steadyReturns = [0.0205, 0.0212, 0.0203, 0.0201];
+      const psr = qs.stats.probabilisticSharpeRatio(steadyReturns);
+
+      assert.equal(psr, 1);
+    });
+
     test('drawdown calculations should be precise', () => {
       const decreasingReturns = [0.1, -0.05, -0.05, -0.05, 0.2];
       const drawdowns = qs.utils.toDrawdownSeries(decreasingReturns);